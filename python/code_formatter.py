@@ -5,9 +5,23 @@ Python Code Formatter
 Formats Python code using black or autopep8, with graceful fallback.
 """
 
+import os
 import sys
 import json
-from typing import Dict, Any, Optional
+import importlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+from typing import Dict, Any, List, Optional
+
+from script_io import read_json, serve, write_json
+
+# Smaller batches are formatted in-process: starting workers and importing the
+# formatter in each of them costs more than formatting a few snippets here
+_MIN_PARALLEL_BATCH = 16
+
+# Worker pool shared by every format_many call, created on first use
+_executor: Optional[ProcessPoolExecutor] = None
 
 
 def format_code(
@@ -96,6 +110,86 @@ def format_code(
             }
 
 
+def format_many(
+    codes: List[str],
+    formatter: str = 'black',
+    line_length: int = 88,
+    skip_on_error: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Format several code snippets, in parallel worker processes for large batches.
+
+    Args:
+        codes: Python code snippets to format
+        formatter: 'black' or 'autopep8'
+        line_length: Maximum line length (default: 88 for black, 79 for autopep8)
+        skip_on_error: If True, return original code on formatting error
+
+    Returns:
+        List of format_code results, in the same order as codes
+    """
+    global _executor
+
+    format_one = partial(
+        format_code,
+        formatter=formatter,
+        line_length=line_length,
+        skip_on_error=skip_on_error
+    )
+
+    workers = os.cpu_count() or 1
+    if len(codes) < _MIN_PARALLEL_BATCH or workers == 1:
+        return [format_one(code) for code in codes]
+
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=workers)
+
+    chunksize = max(1, len(codes) // (workers * 4))
+    try:
+        return list(_executor.map(format_one, codes, chunksize=chunksize))
+    except BrokenProcessPool:
+        # A worker died; release the pool so the next batch starts a fresh one
+        _executor.shutdown(wait=False)
+        _executor = None
+        return [format_one(code) for code in codes]
+
+
+def _import_formatter(name: str) -> Any:
+    """
+    Import a formatter module.
+
+    Successful imports are cached by sys.modules; failures are not cached, so
+    a formatter installed while a --server session is running is picked up.
+
+    Args:
+        name: Module name ('black' or 'autopep8')
+
+    Returns:
+        The imported module
+
+    Raises:
+        ImportError: If the formatter is not installed
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise ImportError(f"{name} is not installed. Install it with: pip install {name}")
+
+
+@lru_cache(maxsize=8)
+def _black_mode(line_length: int) -> Any:
+    """
+    Get a shared black Mode for the given line length.
+
+    Args:
+        line_length: Maximum line length
+
+    Returns:
+        black.Mode instance
+    """
+    return _import_formatter('black').Mode(line_length=line_length)
+
+
 def _format_with_black(code: str, line_length: int) -> str:
     """
     Format code using black.
@@ -111,16 +205,11 @@ def _format_with_black(code: str, line_length: int) -> str:
         ImportError: If black is not installed
         Exception: If formatting fails
     """
-    try:
-        import black
-        from black import Mode
-    except ImportError:
-        raise ImportError("black is not installed. Install it with: pip install black")
+    black = _import_formatter('black')
 
     try:
         # Use black's format_str function
-        mode = Mode(line_length=line_length)
-        formatted = black.format_str(code, mode=mode)
+        formatted = black.format_str(code, mode=_black_mode(line_length))
         return formatted
     except Exception as e:
         raise Exception(f"Black formatting failed: {str(e)}")
@@ -141,10 +230,7 @@ def _format_with_autopep8(code: str, line_length: int) -> str:
         ImportError: If autopep8 is not installed
         Exception: If formatting fails
     """
-    try:
-        import autopep8
-    except ImportError:
-        raise ImportError("autopep8 is not installed. Install it with: pip install autopep8")
+    autopep8 = _import_formatter('autopep8')
 
     try:
         # Use autopep8's fix_code function
@@ -160,48 +246,95 @@ def _format_with_autopep8(code: str, line_length: int) -> str:
         raise Exception(f"autopep8 formatting failed: {str(e)}")
 
 
+def _handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Format the code carried by a single JSON request.
+
+    Args:
+        request: JSON object with 'code' (or a 'codes' list) and optional
+            formatter options
+
+    Returns:
+        Dictionary with formatting results, or {"results": [...]} for 'codes'
+        (with an "error" key and no results if 'codes' is malformed)
+    """
+    formatter = request.get('formatter', 'black')
+    line_length = request.get('line_length', 88)
+    skip_on_error = request.get('skip_on_error', True)
+
+    if 'codes' in request:
+        codes = request['codes']
+        if not isinstance(codes, list) or not all(isinstance(code, str) for code in codes):
+            return {
+                "results": [],
+                "error": "'codes' must be a list of strings"
+            }
+
+        return {
+            "results": format_many(codes, formatter, line_length, skip_on_error)
+        }
+
+    return format_code(request.get('code', ''), formatter, line_length, skip_on_error)
+
+
+def _error_result(error: Exception) -> Dict[str, Any]:
+    """
+    Build the response for a server request that could not be handled.
+
+    Args:
+        error: Exception raised while handling the request
+
+    Returns:
+        Dictionary with formatting results reporting the error
+    """
+    if isinstance(error, json.JSONDecodeError):
+        message = f"Invalid JSON input: {str(error)}"
+    else:
+        message = f"Unexpected error: {str(error)}"
+
+    return {
+        "success": False,
+        "formatted_code": "",
+        "error": message
+    }
+
+
 def main():
     """
     Main entry point for command-line usage.
 
     Expected input: JSON object with fields:
-    - code: str (required)
+    - code: str (required unless codes is given)
+    - codes: list of str (optional, formats a batch; large batches run in parallel)
     - formatter: str (optional, default: 'black')
     - line_length: int (optional, default: 88)
     - skip_on_error: bool (optional, default: true)
 
-    Output: JSON object with formatting results
+    Output: JSON object with formatting results, or {"results": [...]} with
+    one result per entry when codes is given
+
+    With --server, reads newline-delimited JSON requests from stdin and writes
+    one JSON response line per request.
     """
+    if len(sys.argv) > 1 and sys.argv[1] == '--server':
+        serve(_handle_request, _error_result)
+        return
+
     try:
         if len(sys.argv) > 1:
             # Simple mode: code provided as argument
             code = sys.argv[1]
             formatter = sys.argv[2] if len(sys.argv) > 2 else 'black'
             line_length = int(sys.argv[3]) if len(sys.argv) > 3 else 88
-            skip_on_error = True
+            result = format_code(code, formatter, line_length, True)
         else:
             # JSON mode: read from stdin
-            input_data = json.loads(sys.stdin.read())
-            code = input_data.get('code', '')
-            formatter = input_data.get('formatter', 'black')
-            line_length = input_data.get('line_length', 88)
-            skip_on_error = input_data.get('skip_on_error', True)
+            result = _handle_request(read_json(sys.stdin.read()))
 
-        result = format_code(code, formatter, line_length, skip_on_error)
-        print(json.dumps(result, indent=2))
+        write_json(result)
 
-    except json.JSONDecodeError as e:
-        print(json.dumps({
-            "success": False,
-            "formatted_code": "",
-            "error": f"Invalid JSON input: {str(e)}"
-        }))
     except Exception as e:
-        print(json.dumps({
-            "success": False,
-            "formatted_code": "",
-            "error": f"Unexpected error: {str(e)}"
-        }))
+        write_json(_error_result(e))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,90 @@
+"""
+JSON I/O helpers shared by the command-line scripts
+
+Reads requests and writes responses for syntax_validator.py and
+code_formatter.py, using orjson when it is installed.
+"""
+
+import sys
+import json
+from typing import Any, Callable, Dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def read_json(text: str) -> Any:
+    """
+    Parse a JSON document.
+
+    orjson is tried first; input it rejects but the standard library accepts
+    (e.g. escaped lone surrogates) is parsed with json instead.
+
+    Args:
+        text: JSON text to parse
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def write_json(data: Dict[str, Any], indent: bool = True) -> None:
+    """
+    Write a JSON document to stdout.
+
+    Args:
+        data: JSON-serializable dictionary to write
+        indent: If False, write the document on a single line
+    """
+    if orjson is not None:
+        try:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            payload = orjson.dumps(data, option=option)
+        except TypeError:
+            # e.g. lone surrogates, which orjson refuses to encode
+            payload = None
+
+        if payload is not None:
+            sys.stdout.buffer.write(payload + b"\n")
+            sys.stdout.buffer.flush()
+            return
+
+    print(json.dumps(data, indent=2 if indent else None), flush=True)
+
+
+def serve(
+    handle_request: Callable[[Dict[str, Any]], Dict[str, Any]],
+    error_result: Callable[[Exception], Dict[str, Any]]
+) -> None:
+    """
+    Serve newline-delimited JSON requests from stdin until it is closed.
+
+    Each response is written as a single line of JSON, so one process can be
+    reused for a whole session. A request that fails produces an error
+    response instead of stopping the server.
+
+    Args:
+        handle_request: Maps a request object to its response
+        error_result: Builds the response for a request that raised
+    """
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        try:
+            result = handle_request(read_json(line))
+        except Exception as e:
+            result = error_result(e)
+
+        write_json(result, indent=False)
@@ -8,8 +8,21 @@ Validates Python code syntax using AST parsing and returns detailed error inform
 import ast
 import sys
 import json
+from functools import lru_cache
 from typing import Dict, List, Any
 
+from script_io import read_json, serve, write_json
+
+# Largest source whose validation result is cached; the cache key keeps the
+# source text alive, so big files are always validated afresh
+_CACHE_MAX_CODE_SIZE = 64 * 1024
+
+# Node types that can hold statements (and therefore class definitions);
+# match_case only exists on Python 3.10+
+_STATEMENT_NODES = (ast.stmt, ast.excepthandler) + (
+    (ast.match_case,) if hasattr(ast, 'match_case') else ()
+)
+
 
 def validate_syntax(code: str) -> Dict[str, Any]:
     """
@@ -26,6 +39,42 @@ def validate_syntax(code: str) -> Dict[str, Any]:
             "warnings": [...]
         }
     """
+    if not isinstance(code, str) or len(code) > _CACHE_MAX_CODE_SIZE:
+        return _validate(code)
+
+    # Copy the cached result so callers can modify what they get back
+    result = _validate_cached(code)
+    return {
+        "is_valid": result["is_valid"],
+        "errors": [dict(error) for error in result["errors"]],
+        "warnings": [dict(warning) for warning in result["warnings"]]
+    }
+
+
+@lru_cache(maxsize=32)
+def _validate_cached(code: str) -> Dict[str, Any]:
+    """
+    Validate code, reusing the result when the same code is validated again.
+
+    Args:
+        code: Python code string to validate
+
+    Returns:
+        Dictionary with validation results (shared; do not modify)
+    """
+    return _validate(code)
+
+
+def _validate(code: str) -> Dict[str, Any]:
+    """
+    Validate Python code syntax without caching.
+
+    Args:
+        code: Python code string to validate
+
+    Returns:
+        Dictionary with validation results
+    """
     errors = []
     warnings = []
 
@@ -104,29 +153,46 @@ def _check_common_issues(code: str, tree: ast.AST) -> List[Dict[str, Any]]:
     """
     warnings = []
 
-    # Check for mixed tabs and spaces
-    lines = code.split('\n')
-    for i, line in enumerate(lines, 1):
-        if '\t' in line and '    ' in line:
+    # Check for mixed tabs and spaces. Most sources have no tabs at all, so
+    # jump between tab characters and only inspect the lines that hold one
+    line_number = 1
+    counted = 0
+    tab = code.find('\t')
+    while tab != -1:
+        start = code.rfind('\n', 0, tab) + 1
+        end = code.find('\n', tab)
+        if end == -1:
+            end = len(code)
+
+        if code.find('    ', start, end) != -1:
+            line_number += code.count('\n', counted, start)
+            counted = start
             warnings.append({
-                "line": i,
+                "line": line_number,
                 "column": 0,
                 "message": "Mixed tabs and spaces in indentation",
                 "severity": "warning"
             })
 
-    # Check for trailing whitespace
-    for i, line in enumerate(lines, 1):
-        if line.rstrip() != line and line.strip():
+        tab = code.find('\t', end)
+
+    # Check for trailing whitespace; rstrip returns the line itself when
+    # there is nothing to strip, so clean lines allocate nothing extra
+    for i, line in enumerate(code.split('\n'), 1):
+        stripped = line.rstrip()
+        if stripped != line and stripped:
             warnings.append({
                 "line": i,
-                "column": len(line.rstrip()),
+                "column": len(stripped),
                 "message": "Trailing whitespace",
                 "severity": "warning"
             })
 
-    # Check for missing test methods in test classes
-    for node in ast.walk(tree):
+    # Check for missing test methods in test classes. Class definitions only
+    # occur in statement bodies, so expression subtrees are never queued; the
+    # list grows while iterated, giving the same breadth-first order as ast.walk
+    nodes = [tree]
+    for node in nodes:
         if isinstance(node, ast.ClassDef):
             if node.name.startswith('Test'):
                 # This is a test class
@@ -142,23 +208,70 @@ def _check_common_issues(code: str, tree: ast.AST) -> List[Dict[str, Any]]:
                         "severity": "warning"
                     })
 
+        nodes.extend(
+            child for child in ast.iter_child_nodes(node)
+            if isinstance(child, _STATEMENT_NODES)
+        )
+
     return warnings
 
 
+def _handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate the code carried by a single JSON request.
+
+    Args:
+        request: JSON object with 'code' field
+
+    Returns:
+        Dictionary with validation results
+    """
+    return validate_syntax(request.get('code', ''))
+
+
+def _error_result(error: Exception) -> Dict[str, Any]:
+    """
+    Build the response for a server request that could not be handled.
+
+    Args:
+        error: Exception raised while handling the request
+
+    Returns:
+        Dictionary with validation results reporting the error
+    """
+    return {
+        "is_valid": False,
+        "errors": [{
+            "line": 0,
+            "column": 0,
+            "message": f"Invalid request: {str(error)}",
+            "severity": "error"
+        }],
+        "warnings": []
+    }
+
+
 def main():
     """
     Main entry point for command-line usage.
 
     Expected input: JSON object with 'code' field
     Output: JSON object with validation results
+
+    With --server, reads newline-delimited JSON requests from stdin and writes
+    one JSON response line per request.
     """
+    if len(sys.argv) > 1 and sys.argv[1] == '--server':
+        serve(_handle_request, _error_result)
+        return
+
     if len(sys.argv) > 1:
         # Code provided as command-line argument
         code = sys.argv[1]
     else:
         # Read from stdin
         try:
-            input_data = json.loads(sys.stdin.read())
+            input_data = read_json(sys.stdin.read())
             code = input_data.get('code', '')
         except json.JSONDecodeError:
             # Fallback: treat entire stdin as code
@@ -166,7 +279,7 @@ def main():
             code = sys.stdin.read()
 
     result = validate_syntax(code)
-    print(json.dumps(result, indent=2))
+    write_json(result)
 
 
 if __name__ == '__main__':
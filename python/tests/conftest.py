@@ -0,0 +1,29 @@
+"""
+Shared fixtures for the Python script tests
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The scripts are run from their own directory, so import them the same way
+sys.path.insert(0, SCRIPT_DIR)
+
+
+@pytest.fixture
+def run_script():
+    """Run one of the scripts with the given stdin and return its stdout."""
+    def run(script: str, stdin: str, *args: str) -> str:
+        completed = subprocess.run(
+            [sys.executable, os.path.join(SCRIPT_DIR, script), *args],
+            input=stdin.encode('utf-8'),
+            capture_output=True,
+            check=True
+        )
+        return completed.stdout.decode('utf-8')
+
+    return run
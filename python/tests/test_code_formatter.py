@@ -0,0 +1,110 @@
+"""
+Tests for the code formatter's formatter loading and batch formatting
+"""
+
+import importlib.util
+import json
+import sys
+
+import pytest
+
+import code_formatter
+
+
+FAKE_BLACK = '''
+class Mode:
+    def __init__(self, line_length):
+        self.line_length = line_length
+
+
+def format_str(code, mode):
+    return code.replace("=", " = ") + "\\n"
+'''
+
+
+def test_formatter_installed_mid_session_is_picked_up(tmp_path, monkeypatch):
+    if importlib.util.find_spec('black') is not None:
+        pytest.skip("black is installed")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    with pytest.raises(ImportError):
+        code_formatter._import_formatter('black')
+
+    (tmp_path / 'black.py').write_text(FAKE_BLACK)
+    code_formatter._black_mode.cache_clear()
+    try:
+        result = code_formatter.format_code("x=1", skip_on_error=False)
+    finally:
+        sys.modules.pop('black', None)
+        code_formatter._black_mode.cache_clear()
+
+    assert result["success"] is True
+    assert result["formatted_code"] == "x = 1\n"
+
+
+def test_format_many_small_batch_stays_in_process(monkeypatch):
+    monkeypatch.setattr(code_formatter, '_executor', None)
+
+    results = code_formatter.format_many(["a = 1", "  "], formatter='unknown')
+
+    assert code_formatter._executor is None
+    assert [r["formatted_code"] for r in results] == ["a = 1", "  "]
+    assert [r["error"] for r in results] == ["Unknown formatter: unknown", "Code is empty"]
+
+
+def test_format_many_large_batch_reuses_pool_and_keeps_order(monkeypatch):
+    monkeypatch.setattr(code_formatter.os, 'cpu_count', lambda: 2)
+    monkeypatch.setattr(code_formatter, '_executor', None)
+    codes = [f"x{i} = {i}" for i in range(code_formatter._MIN_PARALLEL_BATCH * 2)]
+
+    try:
+        first = code_formatter.format_many(codes, formatter='unknown')
+        executor = code_formatter._executor
+        second = code_formatter.format_many(codes, formatter='unknown')
+        assert executor is not None
+        assert code_formatter._executor is executor
+    finally:
+        if code_formatter._executor is not None:
+            code_formatter._executor.shutdown()
+
+    assert [r["formatted_code"] for r in first] == codes
+    assert second == first
+
+
+@pytest.mark.parametrize('codes', ["ab", ["a", 1], None, {"a": "b"}])
+def test_codes_must_be_a_list_of_strings(codes):
+    result = code_formatter._handle_request({"codes": codes})
+
+    assert result == {
+        "results": [],
+        "error": "'codes' must be a list of strings"
+    }
+
+
+def test_codes_request_returns_results_in_order(run_script):
+    output = run_script('code_formatter.py', '{"codes": ["a = 1", ""], "formatter": "unknown"}\n', '--server')
+
+    results = json.loads(output)["results"]
+    assert [r["formatted_code"] for r in results] == ["a = 1", ""]
+
+
+def test_broken_pool_is_shut_down_and_replaced(monkeypatch):
+    class BrokenExecutor:
+        shut_down = False
+
+        def map(self, fn, codes, chunksize=1):
+            raise code_formatter.BrokenProcessPool("worker died")
+
+        def shutdown(self, wait=True):
+            self.shut_down = True
+
+    broken = BrokenExecutor()
+    monkeypatch.setattr(code_formatter.os, 'cpu_count', lambda: 2)
+    monkeypatch.setattr(code_formatter, '_executor', broken)
+    codes = ["a = 1"] * code_formatter._MIN_PARALLEL_BATCH
+
+    results = code_formatter.format_many(codes, formatter='unknown')
+
+    assert broken.shut_down is True
+    assert code_formatter._executor is None
+    assert [r["formatted_code"] for r in results] == codes
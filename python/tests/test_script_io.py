@@ -0,0 +1,47 @@
+"""
+Tests for the JSON request/response handling shared by the scripts
+"""
+
+import json
+
+from script_io import read_json
+
+
+def test_read_json_accepts_lone_surrogates():
+    assert read_json('{"code": "x = \\ud800 +"}') == {"code": "x = \ud800 +"}
+
+
+def test_validator_reports_error_for_lone_surrogate_code(run_script):
+    output = run_script('syntax_validator.py', '{"code": "x = \\ud800 +"}')
+
+    result = json.loads(output)
+    assert result["is_valid"] is False
+
+
+def test_validator_server_answers_each_line(run_script):
+    requests = '\n'.join([
+        json.dumps({"code": "x = 1"}),
+        '',
+        'not json',
+        json.dumps({"code": "def (:"}),
+    ]) + '\n'
+
+    responses = [json.loads(line) for line in run_script('syntax_validator.py', requests, '--server').splitlines()]
+
+    assert [r["is_valid"] for r in responses] == [True, False, False]
+    assert responses[1]["errors"][0]["message"].startswith("Invalid request:")
+    assert responses[2]["errors"][0]["message"] == "invalid syntax"
+
+
+def test_formatter_server_answers_each_line(run_script):
+    requests = '\n'.join([
+        json.dumps({"code": "x = 1", "formatter": "unknown"}),
+        'not json',
+        json.dumps([1]),
+    ]) + '\n'
+
+    responses = [json.loads(line) for line in run_script('code_formatter.py', requests, '--server').splitlines()]
+
+    assert responses[0] == {"success": False, "formatted_code": "x = 1", "error": "Unknown formatter: unknown"}
+    assert responses[1]["error"].startswith("Invalid JSON input:")
+    assert responses[2]["error"].startswith("Unexpected error:")
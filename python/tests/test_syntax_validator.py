@@ -0,0 +1,85 @@
+"""
+Tests for the syntax validator's common-issue checks
+"""
+
+import ast
+
+import syntax_validator
+from syntax_validator import validate_syntax
+
+
+def _messages(code):
+    return [(w["line"], w["message"]) for w in validate_syntax(code)["warnings"]]
+
+
+def test_statement_nodes_without_match_case(monkeypatch):
+    # Python 3.8/3.9 have no ast.match_case; the tuple must not depend on it
+    monkeypatch.delattr(ast, 'match_case')
+    source = open(syntax_validator.__file__).read()
+    namespace = {'__name__': 'syntax_validator_without_match_case'}
+    exec(compile(source, syntax_validator.__file__, 'exec'), namespace)
+    assert namespace['_STATEMENT_NODES'] == (ast.stmt, ast.excepthandler)
+
+
+def test_nested_test_classes_reported_in_walk_order():
+    code = (
+        "class TestOuter:\n"
+        "    class TestInner:\n"
+        "        pass\n"
+        "def f():\n"
+        "    if True:\n"
+        "        class TestDeep:\n"
+        "            pass\n"
+        "x = lambda: 1\n"
+    )
+
+    expected = [
+        (node.lineno, f"Test class '{node.name}' has no test methods (methods should start with 'test_')")
+        for node in ast.walk(ast.parse(code))
+        if isinstance(node, ast.ClassDef)
+    ]
+    assert _messages(code) == expected
+
+
+def test_repeated_validation_returns_independent_copies():
+    syntax_validator._validate_cached.cache_clear()
+
+    first = validate_syntax("x = 1  \n")
+    first["warnings"][0]["line"] = 99
+    first["warnings"].clear()
+    second = validate_syntax("x = 1  \n")
+
+    assert syntax_validator._validate_cached.cache_info().hits == 1
+    assert second["warnings"] == [
+        {"line": 1, "column": 5, "message": "Trailing whitespace", "severity": "warning"}
+    ]
+
+
+def test_large_sources_are_not_cached():
+    syntax_validator._validate_cached.cache_clear()
+    code = "x = 1\n" * (syntax_validator._CACHE_MAX_CODE_SIZE // 6 + 1)
+
+    assert validate_syntax(code)["is_valid"] is True
+    assert syntax_validator._validate_cached.cache_info().currsize == 0
+
+
+def test_mixed_indentation_and_trailing_whitespace_lines():
+    code = (
+        "def f():\n"
+        "\tif True:\n"
+        "\t    x = 1 \n"
+        "\t\ty = 2\n"
+        "    z = 3\t\n"
+        "\t    \n"
+    )
+
+    # Inconsistent tabs would fail to parse, so run the line checks directly
+    warnings = syntax_validator._check_common_issues(code, ast.parse(""))
+
+    assert [(w["line"], w["message"]) for w in warnings] == [
+        (3, "Mixed tabs and spaces in indentation"),
+        (5, "Mixed tabs and spaces in indentation"),
+        (6, "Mixed tabs and spaces in indentation"),
+        (3, "Trailing whitespace"),
+        (5, "Trailing whitespace"),
+    ]
@@ -6,12 +6,12 @@
 import * as vscode from 'vscode';
 import * as path from 'path';
 import * as fs from 'fs';
-import { spawn } from 'child_process';
 import { CoverageXmlParser, findCoverageFile } from '../parser';
 import { CoverageTreeDataProvider } from '../activityBar';
 import { CoverageBackendClient } from '../api';
 import { UncoveredFunction, PartiallyCoveredFunction, UncoveredRange, RecommendedTest, CoverageReport } from '../api/types';
 import { CoverageConfig } from '../utils/config';
+import { PythonFormatterServer } from '../utils/pythonFormatterServer';
 import { CoverageCodeLensProvider } from '../codelens/coverageCodeLensProvider';
 import { InlinePreviewManager } from '../preview';
 
@@ -25,6 +25,7 @@ export class CoverageCommands {
 	private codeLensProvider: CoverageCodeLensProvider | null = null;
 	private redHighlightStyle: vscode.TextEditorDecorationType;
 	private inlinePreviewManager: InlinePreviewManager | null;
+	private formatterServers = new Map<string, PythonFormatterServer>();
 
 	constructor(
 		treeProvider: CoverageTreeDataProvider,
@@ -884,82 +885,40 @@ export class CoverageCommands {
 	}
 
 	/**
-	 * Run Python formatter script
+	 * Run Python formatter script through its long-lived server process
 	 */
 	private async runPythonFormatter(formatterPath: string, code: string): Promise<string | null> {
-		return new Promise((resolve) => {
-			try {
-				// Prepare input as JSON
-				const input = JSON.stringify({
-					code: code,
-					formatter: 'black',
-					line_length: 88,
-					skip_on_error: true
-				});
-
-				// Execute Python formatter using spawn
-				const pythonProcess = spawn('python3', [formatterPath], {
-					stdio: ['pipe', 'pipe', 'pipe']
-				});
-
-				let stdout = '';
-				let stderr = '';
-
-				pythonProcess.stdout.on('data', (data) => {
-					stdout += data.toString();
-				});
-
-				pythonProcess.stderr.on('data', (data) => {
-					stderr += data.toString();
-				});
-
-				pythonProcess.on('error', (error) => {
-					console.error('[LLT Coverage] Python formatter spawn error:', error);
-					resolve(null);
-				});
-
-				pythonProcess.on('close', (code) => {
-					if (code !== 0) {
-						console.warn('[LLT Coverage] Python formatter exited with code:', code);
-						if (stderr) {
-							console.warn('[LLT Coverage] Python formatter stderr:', stderr);
-						}
-						resolve(null);
-						return;
-					}
-
-					if (stderr && !stderr.includes('warning')) {
-						console.warn('[LLT Coverage] Python formatter stderr:', stderr);
-					}
-
-					try {
-						// Parse result
-						const result = JSON.parse(stdout);
-						if (result.success && result.formatted_code) {
-							resolve(result.formatted_code);
-							return;
-						}
+		try {
+			// One server per script path, i.e. per workspace; it respawns itself after exiting
+			let server = this.formatterServers.get(formatterPath);
+			if (!server) {
+				server = new PythonFormatterServer(formatterPath);
+				this.formatterServers.set(formatterPath, server);
+			}
 
-						if (result.warning) {
-							console.warn('[LLT Coverage] Python formatter warning:', result.warning);
-						}
+			const result = await server.format({
+				code: code,
+				formatter: 'black',
+				line_length: 88,
+				skip_on_error: true
+			});
+			if (!result) {
+				return null;
+			}
 
-						resolve(null);
-					} catch (parseError) {
-						console.error('[LLT Coverage] Python formatter JSON parse error:', parseError);
-						console.error('[LLT Coverage] Python formatter stdout:', stdout);
-						resolve(null);
-					}
-				});
+			if (result.success && result.formatted_code) {
+				return result.formatted_code;
+			}
 
-				// Write input to stdin
-				pythonProcess.stdin.write(input);
-				pythonProcess.stdin.end();
-			} catch (error) {
-				console.error('[LLT Coverage] Python formatter execution error:', error);
-				resolve(null);
+			if (result.warning) {
+				console.warn('[LLT Coverage] Python formatter warning:', result.warning);
 			}
-		});
+
+			return null;
+		} catch (error) {
+			console.error('[LLT Coverage] Python formatter execution error:', error);
+			return null;
+		}
 	}
 
 	/**
@@ -1029,5 +988,7 @@ export class CoverageCommands {
 	dispose(): void {
 		this.statusBarItem.dispose();
 		this.redHighlightStyle.dispose();
+		this.formatterServers.forEach((server) => server.dispose());
+		this.formatterServers.clear();
 	}
 }
@@ -0,0 +1,155 @@
+/**
+ * Long-lived Python formatter process
+ *
+ * Keeps one `code_formatter.py --server` child alive and exchanges one JSON
+ * line per request, so interpreter startup and formatter imports are paid
+ * once per session instead of once per call.
+ */
+
+import { spawn, ChildProcessWithoutNullStreams } from 'child_process';
+
+/**
+ * Request accepted by code_formatter.py
+ */
+export interface PythonFormatterRequest {
+	code: string;
+	formatter?: 'black' | 'autopep8';
+	line_length?: number;
+	skip_on_error?: boolean;
+}
+
+/**
+ * Response returned by code_formatter.py
+ */
+export interface PythonFormatterResponse {
+	success: boolean;
+	formatted_code: string;
+	original_code?: string;
+	error?: string;
+	warning?: string;
+}
+
+type PendingRequest = (response: PythonFormatterResponse | null) => void;
+
+export class PythonFormatterServer {
+	private process: ChildProcessWithoutNullStreams | null = null;
+	private pending: PendingRequest[] = [];
+	private stdoutBuffer = '';
+
+	constructor(
+		private readonly scriptPath: string,
+		private readonly pythonCommand: string = 'python3'
+	) {}
+
+	/**
+	 * Send one request to the server, starting it if needed.
+	 * Resolves to null if the process fails before answering.
+	 */
+	format(request: PythonFormatterRequest): Promise<PythonFormatterResponse | null> {
+		return new Promise((resolve) => {
+			let child: ChildProcessWithoutNullStreams;
+			try {
+				child = this.ensureProcess();
+			} catch (error) {
+				console.error('[LLT Coverage] Python formatter spawn error:', error);
+				resolve(null);
+				return;
+			}
+
+			// Responses arrive in request order, one line each
+			this.pending.push(resolve);
+			child.stdin.write(JSON.stringify(request) + '\n');
+		});
+	}
+
+	/**
+	 * Stop the server process; any waiting requests resolve to null
+	 */
+	dispose(): void {
+		const child = this.process;
+		this.reset();
+		child?.kill();
+	}
+
+	private ensureProcess(): ChildProcessWithoutNullStreams {
+		if (this.process) {
+			return this.process;
+		}
+
+		const child = spawn(this.pythonCommand, [this.scriptPath, '--server'], {
+			stdio: ['pipe', 'pipe', 'pipe']
+		});
+		this.process = child;
+		this.stdoutBuffer = '';
+
+		// Decode as a stream so multi-byte UTF-8 characters split across chunks stay intact
+		child.stdout.setEncoding('utf8');
+		child.stdout.on('data', (data: string) => {
+			if (this.process === child) {
+				this.handleOutput(data);
+			}
+		});
+
+		child.stderr.on('data', (data) => {
+			const stderr = data.toString();
+			if (!stderr.includes('warning')) {
+				console.warn('[LLT Coverage] Python formatter stderr:', stderr);
+			}
+		});
+
+		// Writes to a dead process surface here; the exit/error handlers clean up
+		child.stdin.on('error', (error) => {
+			console.warn('[LLT Coverage] Python formatter stdin error:', error);
+		});
+
+		child.on('error', (error) => {
+			console.error('[LLT Coverage] Python formatter process error:', error);
+			if (this.process === child) {
+				this.reset();
+			}
+		});
+
+		child.on('exit', (code) => {
+			if (this.process === child) {
+				console.warn('[LLT Coverage] Python formatter exited with code:', code);
+				this.reset();
+			}
+		});
+
+		return child;
+	}
+
+	private handleOutput(data: string): void {
+		this.stdoutBuffer += data;
+
+		let newline = this.stdoutBuffer.indexOf('\n');
+		while (newline !== -1) {
+			const line = this.stdoutBuffer.slice(0, newline);
+			this.stdoutBuffer = this.stdoutBuffer.slice(newline + 1);
+
+			const resolve = this.pending.shift();
+			if (resolve) {
+				try {
+					resolve(JSON.parse(line));
+				} catch (parseError) {
+					console.error('[LLT Coverage] Python formatter JSON parse error:', parseError);
+					console.error('[LLT Coverage] Python formatter stdout:', line);
+					resolve(null);
+				}
+			}
+
+			newline = this.stdoutBuffer.indexOf('\n');
+		}
+	}
+
+	/**
+	 * Forget the current process so the next request spawns a new one
+	 */
+	private reset(): void {
+		const pending = this.pending;
+		this.process = null;
+		this.pending = [];
+		this.stdoutBuffer = '';
+		pending.forEach((resolve) => resolve(null));
+	}
+}
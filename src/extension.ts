@@ -291,6 +291,7 @@ export async function activate(context: vscode.ExtensionContext) {
 			coverageCodeLensProvider,
 			inlinePreviewManager  // Shared with F1
 		);
+		context.subscriptions.push(coverageCommands);
 
 		// Register Coverage Analysis commands
 		const analyzeCoverageDisposable = vscode.commands.registerCommand('llt-assistant.analyzeCoverage', () => {
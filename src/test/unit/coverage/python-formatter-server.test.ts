@@ -0,0 +1,70 @@
+/**
+ * Unit tests for PythonFormatterServer
+ * Runs the real code_formatter.py in --server mode
+ */
+
+import { expect } from 'chai';
+import * as path from 'path';
+import { PythonFormatterServer } from '../../../coverage/utils/pythonFormatterServer';
+
+const FORMATTER_PATH = path.resolve(__dirname, '../../../../python/code_formatter.py');
+
+suite('PythonFormatterServer', () => {
+	let server: PythonFormatterServer;
+
+	setup(() => {
+		server = new PythonFormatterServer(FORMATTER_PATH);
+	});
+
+	teardown(() => {
+		server.dispose();
+	});
+
+	test('should reuse one process across requests', async () => {
+		const first = await server.format({ code: 'x = 1', formatter: 'autopep8' });
+		const pid = (server as any).process.pid;
+		const second = await server.format({ code: 'y = 2', formatter: 'autopep8' });
+
+		expect(first?.success).to.be.true;
+		expect(second?.success).to.be.true;
+		expect((server as any).process.pid).to.equal(pid);
+	});
+
+	test('should answer concurrent requests in order', async () => {
+		// An unknown formatter echoes the code back with an error
+		const codes = ['a = 1', 'b = "é"', 'c = 3'];
+		const results = await Promise.all(
+			codes.map((code) => server.format({ code, formatter: 'unknown' as any }))
+		);
+
+		expect(results.map((r) => r?.formatted_code)).to.deep.equal(codes);
+		expect(results.every((r) => r?.error === 'Unknown formatter: unknown')).to.be.true;
+	});
+
+	test('should respawn after the process exits', async () => {
+		await server.format({ code: 'x = 1', formatter: 'unknown' as any });
+		const child = (server as any).process;
+		const exited = new Promise((resolve) => child.once('exit', resolve));
+		child.kill();
+		await exited;
+
+		const result = await server.format({ code: 'y = 2', formatter: 'unknown' as any });
+
+		expect(result?.formatted_code).to.equal('y = 2');
+		expect((server as any).process.pid).to.not.equal(child.pid);
+	});
+
+	test('should resolve pending requests to null on dispose', async () => {
+		const pending = server.format({ code: 'x = 1', formatter: 'unknown' as any });
+		server.dispose();
+
+		expect(await pending).to.be.null;
+	});
+
+	test('should resolve to null when python cannot be started', async () => {
+		const missing = new PythonFormatterServer(FORMATTER_PATH, 'llt-no-such-python');
+
+		expect(await missing.format({ code: 'x = 1' })).to.be.null;
+		missing.dispose();
+	});
+});